@@ -17,5 +17,9 @@ pip install --upgrade pip
 # Install requirements
 pip install -r requirements.txt
 
+# Prime the numba kernel cache (the run scripts use the same directory)
+export NUMBA_CACHE_DIR="${NUMBA_CACHE_DIR:-$PWD/.numba_cache}"
+python scripts/aot_compile.py
+
 echo "✓ Development environment setup complete"
 echo "✓ Activate with: source venv/bin/activate"
@@ -6,6 +6,8 @@
 set -e
 
 source venv/bin/activate
+# Cache compiled numba kernels in the project (shared by all runs)
+export NUMBA_CACHE_DIR="${NUMBA_CACHE_DIR:-$PWD/.numba_cache}"
 export CUDA_VISIBLE_DEVICES=""
 echo "Running RIS+GA framework on CPU..."
 python -m src.main --device cpu --config configs/cpu_config.yaml
@@ -6,5 +6,7 @@
 set -e
 
 source venv/bin/activate
+# Cache compiled numba kernels in the project (shared by all runs)
+export NUMBA_CACHE_DIR="${NUMBA_CACHE_DIR:-$PWD/.numba_cache}"
 echo "Running RIS+GA framework on GPU..."
 python -m src.main --device gpu --config configs/gpu_config.yaml
@@ -9,11 +9,25 @@ This module handles all configuration parameters, including:
 """
 
 import os
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=None)
+def _read_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized per (path, modification time)."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 @dataclass
 class RISConfig:
@@ -68,9 +82,10 @@ class Config:
         }
         
         if config_path and Path(config_path).exists():
-            with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
-                default_config.update(user_config)
+            path = Path(config_path).resolve()
+            # Copy so callers never mutate the cached parse
+            user_config = copy.deepcopy(_read_yaml(str(path), path.stat().st_mtime_ns))
+            default_config.update(user_config)
                 
         return default_config
     
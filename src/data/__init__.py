@@ -1,7 +1,5 @@
 """Data handling and network structures for RIS+GA framework."""
 
-from .network import HealthNetwork
-from .loader import NetworkLoader
-from .preprocessor import NetworkPreprocessor
+from .network import HealthNetwork, CSRGraph
 
-__all__ = ['HealthNetwork', 'NetworkLoader', 'NetworkPreprocessor']
+__all__ = ['HealthNetwork', 'CSRGraph']
@@ -7,6 +7,9 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Edge probabilities are quantized to uint16 at this scale (resolution ~1.5e-5)
+PROB_SCALE = 65535.0
+
 
 @dataclass
 class NodeAttributes:
@@ -29,6 +32,35 @@ class EdgeAttributes:
     interaction_frequency: float = 1.0
 
 
+@dataclass
+class CSRGraph:
+    """
+    Reverse CSR view of a network over relabelled node indices 0..N-1.
+    
+    Predecessors of node ``v`` are ``pred_idx[indptr[v]:indptr[v + 1]]`` with
+    matching probabilities in ``pred_prob`` (float32) and ``pred_prob_q``
+    (uint16, scaled by PROB_SCALE). ``pred_cum_q`` (uint16, same scale) is
+    the running sum of ``pred_prob`` along each row, capped at 1, as used by
+    Linear Threshold sampling. ``node_ids[v]`` is the original node id.
+    """
+    indptr: np.ndarray
+    pred_idx: np.ndarray
+    pred_prob: np.ndarray
+    pred_prob_q: np.ndarray
+    pred_cum_q: np.ndarray
+    node_ids: np.ndarray
+    
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in network."""
+        return len(self.indptr) - 1
+    
+    @property
+    def num_edges(self) -> int:
+        """Number of edges in network."""
+        return len(self.pred_idx)
+
+
 class HealthNetwork:
     """Health-specific network wrapper around NetworkX."""
     
@@ -75,6 +107,62 @@ class HealthNetwork:
             groups[group].append(node_id)
         return groups
     
+    def to_csr(self) -> CSRGraph:
+        """
+        Build the reverse CSR used by RR set sampling.
+        
+        Nodes are relabelled 0..N-1 by descending in-degree so the hub nodes
+        most RR sets pass through share a compact, cache-resident region, and
+        predecessors are sorted ascending within each row. Edge probability is
+        the 'influence_prob' attribute, then 'weight', then 0.1, clamped to [0, 1].
+        ``node_ids`` is int64 when every node is an int, otherwise an object
+        array holding the original (hashable) nodes.
+        """
+        nodes = list(self.graph.nodes())
+        in_degree = np.array([degree for _, degree in self.graph.in_degree(nodes)],
+                             dtype=np.int64)
+        order = np.argsort(-in_degree, kind='stable')
+        if all(isinstance(node, (int, np.integer)) for node in nodes):
+            node_ids = np.array(nodes, dtype=np.int64)[order]
+        else:
+            # Element-wise so tuple nodes are not unpacked into extra dimensions
+            node_ids = np.fromiter((nodes[i] for i in order), dtype=object,
+                                   count=len(nodes))
+        node_index = {node: i for i, node in enumerate(node_ids.tolist())}
+        
+        num_edges = self.graph.number_of_edges()
+        sources = np.empty(num_edges, dtype=np.int32)
+        targets = np.empty(num_edges, dtype=np.int32)
+        probs = np.empty(num_edges, dtype=np.float32)
+        
+        for e, (u, v, data) in enumerate(self.graph.edges(data=True)):
+            prob = data.get('influence_prob', data.get('weight', 0.1))
+            sources[e] = node_index[u]
+            targets[e] = node_index[v]
+            probs[e] = min(max(prob, 0.0), 1.0)
+        
+        # Row pointers from per-target in-degree counts
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(targets, minlength=len(nodes)), out=indptr[1:])
+        
+        # Group edges by target, predecessors ascending within each row
+        order = np.lexsort((sources, targets))
+        pred_prob = probs[order]
+        
+        # Inclusive per-row prefix sums of the incoming weights
+        running = np.concatenate(([0.0], np.cumsum(pred_prob, dtype=np.float64)))
+        cum_prob = running[1:] - np.repeat(running[indptr[:-1]], np.diff(indptr))
+        cum_q = np.round(np.minimum(cum_prob, 1.0) * PROB_SCALE).astype(np.uint16)
+        
+        return CSRGraph(
+            indptr=indptr,
+            pred_idx=sources[order],
+            pred_prob=pred_prob,
+            pred_prob_q=np.round(pred_prob * PROB_SCALE).astype(np.uint16),
+            pred_cum_q=cum_q,
+            node_ids=node_ids
+        )
+    
     @property
     def num_nodes(self) -> int:
         """Number of nodes in network."""
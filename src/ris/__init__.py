@@ -5,6 +5,6 @@ This module implements efficient RIS algorithms optimized for multi-core systems
 providing the foundation for influence maximization through reverse reachable set sampling.
 """
 
-from .rr_set_generator import RRSetGenerator, RRSet
+from .rr_set_generator import RRSetGenerator, RRSet, RRSetCollection
 
-__all__ = ['RRSetGenerator', 'RRSet']
\ No newline at end of file
+__all__ = ['RRSetGenerator', 'RRSet', 'RRSetCollection']
\ No newline at end of file
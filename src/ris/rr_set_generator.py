@@ -5,29 +5,573 @@ This module implements parallel generation of RR sets with memory optimization
 and support for different diffusion models (Independent Cascade, Linear Threshold).
 """
 
-import random
+import operator
 import numpy as np
 import networkx as nx
-from typing import List, Set, Dict, Tuple, Optional
-from multiprocessing import Pool, Manager
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Set, Dict, Tuple, Optional, Union
+import heapq
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numba
+from numba import cuda, literally, njit, prange
+
+from ..data.network import HealthNetwork
 
 logger = logging.getLogger(__name__)
 
+# Member slab sizing: average RR set size is estimated from this many
+# pilot RR sets, and the slab holds this multiple of the expected total
+_PILOT_RR_SETS = 1024
+_SLAB_OVERSIZE = 2.0
+
+# CUDA launch geometry: threads per block, and the most member plus
+# visited-table slots (int32) allocated on the device per launch
+_CUDA_THREADS_PER_BLOCK = 256
+_CUDA_MAX_SLOTS = 1 << 26
+
+# Per-thread CUDA output slices hold this percentile of pilot RR set sizes;
+# larger RR sets are redone on the CPU
+_CUDA_CAPACITY_PERCENTILE = 99.0
+
+
+@njit(cache=True)
+def _splitmix64(state: np.uint64) -> Tuple[np.uint64, np.uint64]:
+    """Advance a splitmix64 state; returns (new_state, output)."""
+    state = state + np.uint64(0x9E3779B97F4A7C15)
+    z = state
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return state, z ^ (z >> np.uint64(31))
+
+
+@njit(cache=True)
+def _rotl(x: np.uint64, k: int) -> np.uint64:
+    return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+
+
+@njit(cache=True)
+def _xoroshiro_next(s0: np.uint64,
+                    s1: np.uint64) -> Tuple[np.uint64, np.uint64, np.uint64]:
+    """One xoroshiro128++ step; returns (output, new_s0, new_s1)."""
+    result = _rotl(s0 + s1, 17) + s0
+    s1 = s1 ^ s0
+    s0 = _rotl(s0, 49) ^ s1 ^ (s1 << np.uint64(21))
+    s1 = _rotl(s1, 28)
+    return result, s0, s1
+
+
+@njit(cache=True)
+def _draw_u16(bits: np.uint64) -> np.uint64:
+    """
+    Map the low 16 bits of ``bits`` uniformly onto [0, 65535).
+    
+    Against probabilities quantized at PROB_SCALE, 0.0 never fires and 1.0
+    always fires.
+    """
+    return ((bits & np.uint64(0xFFFF)) * np.uint64(0xFFFF)) >> np.uint64(16)
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def _ic_rr_set_csr(root: int, seed: int,
+                   indptr: np.ndarray, pred_idx: np.ndarray, pred_prob_q: np.ndarray,
+                   visited: np.ndarray, queue: np.ndarray) -> int:
+    """
+    Reverse BFS for one Independent Cascade RR set over the reverse CSR.
+    
+    Edge coins are integer compares of 16-bit draws against ``pred_prob_q``
+    (uint16 probabilities scaled by PROB_SCALE); each xoroshiro128++ output
+    supplies four draws.
+    
+    ``visited`` (all-zero uint64 bitmap, one bit per node, see
+    _visited_bitmap) and ``queue`` (int32[num_nodes]) are caller-owned
+    scratch buffers; ``visited`` is reset before returning so the same
+    buffers can be reused for the next RR set.
+    
+    Returns:
+        RR set size; members (relabelled indices, root first) are left in
+        ``queue[:size]``
+    """
+    mix, s0 = _splitmix64(np.uint64(seed))
+    mix, s1 = _splitmix64(mix)
+    bits = np.uint64(0)
+    lanes = 0
+    
+    queue[0] = root
+    visited[root >> 6] |= np.uint64(1) << np.uint64(root & 63)
+    head = 0
+    tail = 1
+    
+    while head < tail:
+        current = queue[head]
+        head += 1
+        
+        for e in range(indptr[current], indptr[current + 1]):
+            predecessor = pred_idx[e]
+            bit = np.uint64(1) << np.uint64(predecessor & 63)
+            if visited[predecessor >> 6] & bit:
+                continue
+            
+            if lanes == 0:
+                bits, s0, s1 = _xoroshiro_next(s0, s1)
+                lanes = 4
+            draw = _draw_u16(bits)
+            bits >>= np.uint64(16)
+            lanes -= 1
+            
+            if draw < pred_prob_q[e]:
+                visited[predecessor >> 6] |= bit
+                queue[tail] = predecessor
+                tail += 1
+    
+    # The queue holds every visited node, so zeroing their words clears all
+    for i in range(tail):
+        visited[queue[i] >> 6] = 0
+    
+    return tail
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def _lt_rr_set_csr(root: int, seed: int,
+                   indptr: np.ndarray, pred_idx: np.ndarray, pred_cum_q: np.ndarray,
+                   visited: np.ndarray, queue: np.ndarray) -> int:
+    """
+    Reverse random walk for one Linear Threshold RR set over the reverse CSR.
+    
+    Under LT each node has at most one live in-edge, taken with probability
+    equal to its weight. ``pred_cum_q`` holds each row's running weight sum,
+    so one 16-bit draw per step picks the first predecessor whose running
+    sum exceeds it (or none). The walk stops at a node with no live in-edge
+    or on reaching a node already in the RR set.
+    
+    Scratch buffers, seeding and the return value are as in _ic_rr_set_csr.
+    """
+    mix, s0 = _splitmix64(np.uint64(seed))
+    mix, s1 = _splitmix64(mix)
+    bits = np.uint64(0)
+    lanes = 0
+    
+    queue[0] = root
+    visited[root >> 6] |= np.uint64(1) << np.uint64(root & 63)
+    tail = 1
+    current = root
+    
+    while True:
+        if lanes == 0:
+            bits, s0, s1 = _xoroshiro_next(s0, s1)
+            lanes = 4
+        draw = _draw_u16(bits)
+        bits >>= np.uint64(16)
+        lanes -= 1
+        
+        e = indptr[current]
+        end = indptr[current + 1]
+        while e < end and draw >= pred_cum_q[e]:
+            e += 1
+        if e == end:
+            break
+        
+        current = pred_idx[e]
+        bit = np.uint64(1) << np.uint64(current & 63)
+        if visited[current >> 6] & bit:
+            break
+        visited[current >> 6] |= bit
+        queue[tail] = current
+        tail += 1
+    
+    for i in range(tail):
+        visited[queue[i] >> 6] = 0
+    
+    return tail
+
+
+@njit(cache=True)
+def _visited_bitmap(num_nodes: int) -> np.ndarray:
+    """Zeroed visited bitmap: node ``v`` is bit ``v & 63`` of word ``v >> 6``."""
+    return np.zeros((num_nodes + 63) >> 6, dtype=np.uint64)
+
+
+@njit(cache=True)
+def _rr_set_csr(lt: bool, root: int, seed: int,
+                indptr: np.ndarray, pred_idx: np.ndarray, weights_q: np.ndarray,
+                visited: np.ndarray, queue: np.ndarray) -> int:
+    """
+    Run the LT or IC kernel for one RR set.
+    
+    The drivers pass ``lt`` as a compile-time literal, so each model gets
+    its own specialization with this branch folded away.
+    """
+    if lt:
+        return _lt_rr_set_csr(root, seed, indptr, pred_idx, weights_q,
+                              visited, queue)
+    return _ic_rr_set_csr(root, seed, indptr, pred_idx, weights_q,
+                          visited, queue)
+
+
+@njit(cache=True)
+def _invert_rr_sets(offsets: np.ndarray, members: np.ndarray,
+                    num_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transpose RR sets into a node -> RR set id CSR (counting sort).
+    
+    Returns:
+        (inv_indptr: int64[num_nodes + 1], inv_rr_ids: int32[len(members)])
+        where the RR sets containing node ``v`` are
+        ``inv_rr_ids[inv_indptr[v]:inv_indptr[v + 1]]``
+    """
+    inv_indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    for j in range(len(members)):
+        inv_indptr[members[j] + 1] += 1
+    for v in range(num_nodes):
+        inv_indptr[v + 1] += inv_indptr[v]
+    
+    cursor = inv_indptr[:-1].copy()
+    inv_rr_ids = np.empty(len(members), dtype=np.int32)
+    for i in range(len(offsets) - 1):
+        for j in range(offsets[i], offsets[i + 1]):
+            node = members[j]
+            inv_rr_ids[cursor[node]] = i
+            cursor[node] += 1
+    
+    return inv_indptr, inv_rr_ids
+
+
+@njit(cache=True)
+def _popcount64(x: np.uint64) -> int:
+    """SWAR population count of a 64-bit word."""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    m2 = np.uint64(0x3333333333333333)
+    x = (x & m2) + ((x >> np.uint64(2)) & m2)
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return int((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def _estimate_influence_kernel(inv_indptr: np.ndarray, inv_rr_ids: np.ndarray,
+                               seeds: np.ndarray, num_rr_sets: int) -> int:
+    """
+    Count RR sets containing at least one seed via the inverted index.
+    
+    Sets one bit per RR set id reached from any seed and popcounts the
+    bitset, so the cost is the seeds' total coverage plus theta / 64 words.
+    """
+    covered = np.zeros((num_rr_sets + 63) >> 6, dtype=np.uint64)
+    for s in seeds:
+        for k in range(inv_indptr[s], inv_indptr[s + 1]):
+            rr_id = inv_rr_ids[k]
+            covered[rr_id >> 6] |= np.uint64(1) << np.uint64(rr_id & 63)
+    
+    count = 0
+    for word in covered:
+        count += _popcount64(word)
+    return count
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def _greedy_seed_kernel(offsets: np.ndarray, members: np.ndarray,
+                        inv_indptr: np.ndarray, inv_rr_ids: np.ndarray,
+                        k: int) -> Tuple[np.ndarray, int]:
+    """
+    Lazy greedy maximum coverage over RR sets (CELF-style max-heap).
+    
+    Marginal coverage only ever decreases, so a popped heap entry whose key
+    is stale is re-pushed with its current coverage instead of being
+    recomputed eagerly. Picking a node marks its RR sets covered and
+    decrements the coverage of every other member of those RR sets.
+    
+    Returns:
+        (seeds: int64[<= k] relabelled indices, number of RR sets covered)
+    """
+    num_nodes = len(inv_indptr) - 1
+    coverage = inv_indptr[1:] - inv_indptr[:-1]
+    covered = np.zeros(len(offsets) - 1, dtype=np.uint8)
+    
+    heap = [(-coverage[v], v) for v in range(num_nodes)]
+    heapq.heapify(heap)
+    
+    seeds = np.empty(min(k, num_nodes), dtype=np.int64)
+    num_seeds = 0
+    total_covered = 0
+    
+    while num_seeds < len(seeds):
+        neg_coverage, v = heapq.heappop(heap)
+        if -neg_coverage != coverage[v]:
+            heapq.heappush(heap, (-coverage[v], v))
+            continue
+        
+        seeds[num_seeds] = v
+        num_seeds += 1
+        total_covered += coverage[v]
+        
+        for pos in range(inv_indptr[v], inv_indptr[v + 1]):
+            rr_id = inv_rr_ids[pos]
+            if covered[rr_id]:
+                continue
+            covered[rr_id] = 1
+            for j in range(offsets[rr_id], offsets[rr_id + 1]):
+                coverage[members[j]] -= 1
+    
+    return seeds, total_covered
+
+
+@njit(parallel=True, cache=True)
+def _rr_set_sizes(lt: bool, indptr: np.ndarray, pred_idx: np.ndarray,
+                  weights_q: np.ndarray, roots: np.ndarray, seeds: np.ndarray,
+                  num_chunks: int) -> np.ndarray:
+    """Sizing pass: run every RR set once and record its size only."""
+    lt = literally(lt)
+    theta = len(roots)
+    num_nodes = len(indptr) - 1
+    sizes = np.empty(theta, dtype=np.int64)
+    
+    # One contiguous chunk per thread so scratch buffers are reused across RR sets
+    for c in prange(num_chunks):
+        visited = _visited_bitmap(num_nodes)
+        queue = np.empty(num_nodes, dtype=np.int32)
+        for i in range(c * theta // num_chunks, (c + 1) * theta // num_chunks):
+            sizes[i] = _rr_set_csr(lt, roots[i], seeds[i], indptr, pred_idx,
+                                   weights_q, visited, queue)
+    
+    return sizes
+
+
+@njit(parallel=True, cache=True)
+def _generate_all_rr_sets(lt: bool, indptr: np.ndarray, pred_idx: np.ndarray,
+                          weights_q: np.ndarray, roots: np.ndarray, seeds: np.ndarray,
+                          out_offsets: np.ndarray, out_members: np.ndarray,
+                          num_chunks: int):
+    """
+    Exact fill: regenerate every RR set into its pre-sized output slot.
+    
+    RR set ``i`` is written to ``out_members[out_offsets[i]:out_offsets[i + 1]]``;
+    per-RR-set seeding makes it identical to the one sized by _rr_set_sizes.
+    """
+    lt = literally(lt)
+    theta = len(roots)
+    num_nodes = len(indptr) - 1
+    
+    for c in prange(num_chunks):
+        visited = _visited_bitmap(num_nodes)
+        queue = np.empty(num_nodes, dtype=np.int32)
+        for i in range(c * theta // num_chunks, (c + 1) * theta // num_chunks):
+            size = _rr_set_csr(lt, roots[i], seeds[i], indptr, pred_idx,
+                               weights_q, visited, queue)
+            out_members[out_offsets[i]:out_offsets[i] + size] = queue[:size]
+
+
+@njit(parallel=True, cache=True)
+def _fill_rr_set_slab(lt: bool, indptr: np.ndarray, pred_idx: np.ndarray,
+                      weights_q: np.ndarray, roots: np.ndarray, seeds: np.ndarray,
+                      sizes: np.ndarray, slab: np.ndarray,
+                      num_chunks: int) -> np.ndarray:
+    """
+    Single pass: write RR sets back to back into a preallocated slab.
+    
+    Each thread-chunk of RR sets owns a slice of ``slab`` proportional to
+    its share of theta and records each RR set's size in ``sizes``. A chunk
+    that would overflow its slice stops early.
+    
+    Returns:
+        int64[num_chunks] index of the first RR set each chunk did not write
+        (the chunk's end when it fit entirely)
+    """
+    lt = literally(lt)
+    theta = len(roots)
+    num_nodes = len(indptr) - 1
+    capacity = len(slab)
+    stops = np.empty(num_chunks, dtype=np.int64)
+    
+    for c in prange(num_chunks):
+        lo = c * theta // num_chunks
+        hi = (c + 1) * theta // num_chunks
+        cursor = lo * capacity // theta
+        end = hi * capacity // theta
+        stops[c] = hi
+        
+        visited = _visited_bitmap(num_nodes)
+        queue = np.empty(num_nodes, dtype=np.int32)
+        for i in range(lo, hi):
+            size = _rr_set_csr(lt, roots[i], seeds[i], indptr, pred_idx,
+                               weights_q, visited, queue)
+            if cursor + size > end:
+                stops[c] = i
+                break
+            slab[cursor:cursor + size] = queue[:size]
+            cursor += size
+            sizes[i] = size
+    
+    return stops
+
+
+@cuda.jit(device=True)
+def _visited_slot_cuda(tables, base, mask, node):
+    """
+    Linear-probing lookup in the visited table at ``tables[base:base + mask + 1]``.
+    
+    Returns the index of ``node``'s slot, or of the empty (-1) slot where it
+    would be inserted.
+    """
+    slot = ((np.int64(node) * 2654435761) >> 16) & mask
+    while tables[base + slot] != -1 and tables[base + slot] != node:
+        slot = (slot + 1) & mask
+    return base + slot
+
+
+@cuda.jit
+def _ic_rr_sets_cuda(indptr, pred_idx, pred_prob_q, roots, seeds, capacity,
+                     tables, table_mask, sizes, out_members):
+    """
+    CUDA kernel: one thread generates one IC RR set.
+    
+    Thread ``i`` owns ``out_members[i * capacity:(i + 1) * capacity]`` as its
+    BFS queue and output, and the visited set
+    ``tables[i * (table_mask + 1):(i + 1) * (table_mask + 1)]``: an
+    open-addressing hash table of node ids (-1 = empty) at most half full,
+    so its size follows ``capacity`` rather than the node count. Members
+    are deleted in reverse insertion order on exit, which leaves the table
+    empty for the next launch. The RNG stream and draw order match
+    _ic_rr_set_csr, so results are identical to the CPU path. An RR set
+    that outgrows ``capacity`` gets ``sizes[i] = -1`` for the host to redo.
+    """
+    i = cuda.grid(1)
+    if i >= roots.shape[0]:
+        return
+    
+    # uint64 casts are no-ops on the device; they keep the CUDA simulator's
+    # boxed integers from being retyped as int64 between helper calls
+    base = i * capacity
+    table_base = i * (table_mask + 1)
+    mix, s0 = _splitmix64(np.uint64(seeds[i]))
+    mix, s1 = _splitmix64(np.uint64(mix))
+    s0 = np.uint64(s0)
+    s1 = np.uint64(s1)
+    bits = np.uint64(0)
+    lanes = 0
+    
+    root = roots[i]
+    out_members[base] = root
+    tables[_visited_slot_cuda(tables, table_base, table_mask, root)] = root
+    head = 0
+    tail = 1
+    overflow = False
+    
+    while head < tail and not overflow:
+        current = out_members[base + head]
+        head += 1
+        
+        for e in range(indptr[current], indptr[current + 1]):
+            predecessor = pred_idx[e]
+            slot = _visited_slot_cuda(tables, table_base, table_mask, predecessor)
+            if tables[slot] != -1:
+                continue
+            
+            if lanes == 0:
+                bits, s0, s1 = _xoroshiro_next(s0, s1)
+                bits = np.uint64(bits)
+                s0 = np.uint64(s0)
+                s1 = np.uint64(s1)
+                lanes = 4
+            draw = _draw_u16(bits)
+            bits = np.uint64(bits >> np.uint64(16))
+            lanes -= 1
+            
+            if draw < pred_prob_q[e]:
+                if tail == capacity:
+                    overflow = True
+                    break
+                tables[slot] = predecessor
+                out_members[base + tail] = predecessor
+                tail += 1
+    
+    for j in range(tail - 1, -1, -1):
+        node = out_members[base + j]
+        tables[_visited_slot_cuda(tables, table_base, table_mask, node)] = -1
+    sizes[i] = -1 if overflow else tail
+
+
+@cuda.jit
+def _compact_rr_sets_cuda(padded, capacity, offsets, out_members):
+    """
+    CUDA kernel: copy RR set ``i`` from its padded slice to ``offsets[i]``.
+    
+    ``offsets`` has one more entry than there are RR sets; overflowed RR
+    sets get an empty range.
+    """
+    i = cuda.grid(1)
+    if i >= offsets.shape[0] - 1:
+        return
+    
+    start = offsets[i]
+    for j in range(offsets[i + 1] - start):
+        out_members[start + j] = padded[i * capacity + j]
+
 
 @dataclass
 class RRSet:
     """Represents a single Reverse Reachable set."""
     nodes: Set[int]
     root_node: int
-    size: int
+    size: int = 0
     
     def __post_init__(self):
         self.size = len(self.nodes)
 
 
+@dataclass(eq=False)
+class RRSetCollection:
+    """
+    Flat storage of theta RR sets over relabelled node indices.
+    
+    RR set ``i`` is ``members[offsets[i]:offsets[i + 1]]`` with root
+    ``roots[i]``; ``node_ids`` maps relabelled indices back to original node
+    ids. This is the only storage for RR sets: indexing or iterating builds
+    RRSet objects on demand for callers that want Python sets, but nothing
+    in this module materializes them.
+    """
+    offsets: np.ndarray
+    members: np.ndarray
+    roots: np.ndarray
+    node_ids: np.ndarray
+    _inverted: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def inverted_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Node -> RR set id index, built on first use and cached.
+        
+        Returns:
+            (inv_indptr, inv_rr_ids) where the ids of RR sets containing
+            relabelled node ``v`` are ``inv_rr_ids[inv_indptr[v]:inv_indptr[v + 1]]``
+        """
+        if self._inverted is None:
+            self._inverted = _invert_rr_sets(self.offsets, self.members,
+                                             len(self.node_ids))
+        return self._inverted
+    
+    @property
+    def sizes(self) -> np.ndarray:
+        """Size of every RR set."""
+        return np.diff(self.offsets)
+    
+    def __len__(self) -> int:
+        return len(self.roots)
+    
+    def __getitem__(self, i: int) -> RRSet:
+        if isinstance(i, slice):
+            raise TypeError("RRSetCollection does not support slicing")
+        i = operator.index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("RR set index out of range")
+        
+        members = self.members[self.offsets[i]:self.offsets[i + 1]]
+        return RRSet(nodes=set(self.node_ids[members].tolist()),
+                     root_node=self.node_ids[self.roots[i:i + 1]].tolist()[0])
+    
+    def __iter__(self) -> Iterator[RRSet]:
+        return (self[i] for i in range(len(self)))
+
+
 class RRSetGenerator:
     """
     Generates Reverse Reachable (RR) sets for influence maximization.
@@ -36,22 +580,21 @@ class RRSetGenerator:
     """
     
     def __init__(self, 
-                 graph: nx.DiGraph,
+                 graph: Union[nx.DiGraph, HealthNetwork],
                  diffusion_model: str = 'IC',  # Independent Cascade
                  parallel_workers: int = 4,
-                 random_seed: int = 42):
+                 random_seed: int = 42,
+                 device: str = 'cpu'):
         """
         Initialize RR Set Generator.
         
         Args:
-            graph: Directed graph representing the network
+            graph: Directed graph (or HealthNetwork) representing the network
             diffusion_model: 'IC' (Independent Cascade) or 'LT' (Linear Threshold)
-            parallel_workers: Number of parallel processes
+            parallel_workers: Number of parallel threads
             random_seed: Random seed for reproducibility
+            device: 'cpu', or 'cuda'/'gpu' to generate IC RR sets on the GPU
         """
-        self.graph = graph
-        self.nodes = list(graph.nodes())
-        self.num_nodes = len(self.nodes)
         self.diffusion_model = diffusion_model.upper()
         self.parallel_workers = parallel_workers
         self.random_seed = random_seed
@@ -60,209 +603,333 @@ class RRSetGenerator:
         if self.diffusion_model not in ['IC', 'LT']:
             raise ValueError("diffusion_model must be 'IC' or 'LT'")
         
-        # Pre-compute edge probabilities for efficiency
-        self._edge_probs = self._precompute_edge_probabilities()
+        # Sampling only ever touches the reverse CSR, never the graph itself
+        network = graph if isinstance(graph, HealthNetwork) else HealthNetwork(graph)
+        csr = network.to_csr()
+        self._indptr = csr.indptr
+        self._pred_idx = csr.pred_idx
+        self._node_ids = csr.node_ids
+        
+        # The model is fixed here: LT walks cumulative in-weights, IC flips
+        # per-edge coins, and the drivers are specialized on the flag
+        self._lt = self.diffusion_model == 'LT'
+        self._weights_q = csr.pred_cum_q if self._lt else csr.pred_prob_q
+        
+        # Public node list stays in graph order; _node_index maps node ids to
+        # the relabelled indices used by the CSR and the RR sets
+        self.nodes = list(network.graph.nodes())
+        self.num_nodes = csr.num_nodes
+        self._node_index = {node: i for i, node in enumerate(csr.node_ids.tolist())}
+        
+        # Member slab, reused across generate_rr_sets calls
+        self._members_slab: Optional[np.ndarray] = None
+        
+        self.device = self._select_device(device)
+        self._device_csr = None
         
         logger.info(f"RRSetGenerator initialized: {self.num_nodes} nodes, "
-                   f"{self.graph.number_of_edges()} edges, "
+                   f"{csr.num_edges} edges, "
                    f"model: {self.diffusion_model}, workers: {self.parallel_workers}")
 
-    def _precompute_edge_probabilities(self) -> Dict[Tuple[int, int], float]:
-        """Precompute edge probabilities for faster access."""
-        edge_probs = {}
-        
-        for u, v, data in self.graph.edges(data=True):
-            # Use 'influence_prob' if available, otherwise default
-            prob = data.get('influence_prob', data.get('weight', 0.1))
-            edge_probs[(u, v)] = min(max(prob, 0.0), 1.0)  # Clamp to [0,1]
-            
-        return edge_probs
+    def _select_device(self, device: str) -> str:
+        """Select 'cuda' or 'cpu' based on availability and preference."""
+        if device.lower() in ('cuda', 'gpu'):
+            if not cuda.is_available():
+                logger.warning("CUDA not available, falling back to CPU")
+            elif self.diffusion_model != 'IC':
+                logger.warning("CUDA RR set generation supports IC only, using CPU")
+            else:
+                return 'cuda'
+        return 'cpu'
+
+    def _set_cpu_threads(self) -> int:
+        """Use ``parallel_workers`` numba threads (capped by the pool size)."""
+        num_threads = min(self.parallel_workers, numba.config.NUMBA_NUM_THREADS)
+        numba.set_num_threads(num_threads)
+        return num_threads
 
-    def _generate_single_rr_set_ic(self, root_node: int, worker_seed: int) -> RRSet:
+    def _generate_ic_batch_cuda(self, roots: np.ndarray,
+                                seeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate single RR set using Independent Cascade model.
-        
-        Args:
-            root_node: Starting node for reverse reachable set
-            worker_seed: Random seed for this worker
-            
-        Returns:
-            RRSet object containing reachable nodes
+        Generate IC RR sets on the GPU, one CUDA thread per RR set.
+        
+        The reverse CSR is copied to the device once per generator. Each RR
+        set gets a fixed output slice sized at the _CUDA_CAPACITY_PERCENTILE
+        percentile of pilot RR set sizes, plus a visited hash table of twice
+        that (rounded up to a power of two); launches are split so no launch
+        exceeds _CUDA_MAX_SLOTS slots. After each launch the slices are
+        compacted on the device and only the RR set members are copied back.
+        RR sets that outgrow their slice are regenerated on the CPU with
+        ``parallel_workers`` threads.
         """
-        # Fix: Convert numpy types to Python int
-        worker_seed = int(worker_seed)
-        root_node = int(root_node)
-        
-        np.random.seed(worker_seed)
-        random.seed(worker_seed)
-        
-        # Reverse BFS from root_node
-        rr_set = {root_node}
-        queue = [root_node]
-        
-        while queue:
-            current = queue.pop(0)
+        theta = len(roots)
+        offsets = np.zeros(theta + 1, dtype=np.int64)
+        if theta == 0:
+            return offsets, np.empty(0, dtype=np.int32)
+        
+        num_threads = self._set_cpu_threads()
+        csr = (self._indptr, self._pred_idx, self._weights_q)
+        if self._device_csr is None:
+            self._device_csr = tuple(cuda.to_device(array) for array in csr)
+        
+        pilot = min(_PILOT_RR_SETS, theta)
+        pilot_sizes = _rr_set_sizes(False, *csr, roots[:pilot], seeds[:pilot],
+                                    num_threads)
+        capacity = int(np.ceil(np.percentile(pilot_sizes, _CUDA_CAPACITY_PERCENTILE)))
+        capacity = min(self.num_nodes, capacity)
+        table_size = 1 << int(2 * capacity - 1).bit_length()
+        per_launch = max(1, _CUDA_MAX_SLOTS // (capacity + table_size))
+        
+        # Threads empty their tables on exit, so one set serves every launch
+        launch_rows = min(per_launch, theta)
+        d_tables = cuda.to_device(np.full(launch_rows * table_size, -1,
+                                          dtype=np.int32))
+        d_padded = cuda.device_array(launch_rows * capacity, dtype=np.int32)
+        
+        pieces = []
+        for start in range(0, theta, per_launch):
+            stop = min(start + per_launch, theta)
+            count = stop - start
+            blocks = (count + _CUDA_THREADS_PER_BLOCK - 1) // _CUDA_THREADS_PER_BLOCK
+            d_sizes = cuda.device_array(count, dtype=np.int64)
+            _ic_rr_sets_cuda[blocks, _CUDA_THREADS_PER_BLOCK](
+                *self._device_csr, cuda.to_device(roots[start:stop]),
+                cuda.to_device(seeds[start:stop]), capacity, d_tables,
+                table_size - 1, d_sizes, d_padded)
+            sizes = d_sizes.copy_to_host()
+            
+            # Compact this launch's slices on the device (overflow rows empty)
+            device_offsets = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(np.maximum(sizes, 0), out=device_offsets[1:])
+            d_members = cuda.device_array(device_offsets[-1], dtype=np.int32)
+            _compact_rr_sets_cuda[blocks, _CUDA_THREADS_PER_BLOCK](
+                d_padded, capacity, cuda.to_device(device_offsets), d_members)
+            members = d_members.copy_to_host()
             
-            # Check all incoming edges to current node
-            for predecessor in self.graph.predecessors(current):
-                edge_prob = self._edge_probs.get((predecessor, current), 0.1)
+            overflow = np.flatnonzero(sizes < 0)
+            if len(overflow):
+                logger.debug(f"CUDA capacity overflow: {len(overflow)} RR sets on CPU")
+                redo_roots = roots[start:stop][overflow]
+                redo_seeds = seeds[start:stop][overflow]
+                sizes[overflow] = _rr_set_sizes(False, *csr, redo_roots, redo_seeds,
+                                                num_threads)
+                redo_offsets = np.zeros(len(overflow) + 1, dtype=np.int64)
+                np.cumsum(sizes[overflow], out=redo_offsets[1:])
+                redo_members = np.empty(redo_offsets[-1], dtype=np.int32)
+                _generate_all_rr_sets(False, *csr, redo_roots, redo_seeds,
+                                      redo_offsets, redo_members, num_threads)
                 
-                # Flip coin for influence propagation (reverse direction)
-                if predecessor not in rr_set and np.random.random() < edge_prob:
-                    rr_set.add(predecessor)
-                    queue.append(predecessor)
+                # Interleave device and CPU RR sets in root order
+                launch_offsets = np.zeros(count + 1, dtype=np.int64)
+                np.cumsum(sizes, out=launch_offsets[1:])
+                merged = np.empty(launch_offsets[-1], dtype=np.int32)
+                shift = np.repeat(launch_offsets[:-1] - device_offsets[:-1],
+                                  np.diff(device_offsets))
+                merged[shift + np.arange(len(members))] = members
+                shift = np.repeat(launch_offsets[overflow] - redo_offsets[:-1],
+                                  sizes[overflow])
+                merged[shift + np.arange(len(redo_members))] = redo_members
+                members = merged
+            
+            offsets[start + 1:stop + 1] = sizes
+            pieces.append(members)
         
-        return RRSet(nodes=rr_set, root_node=root_node, size=len(rr_set))
+        np.cumsum(offsets, out=offsets)
+        return offsets, np.concatenate(pieces)
 
-    def _generate_single_rr_set_lt(self, root_node: int, worker_seed: int) -> RRSet:
+    def _generate_batch(self, roots: np.ndarray,
+                        seeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate single RR set using Linear Threshold model.
-        
-        Args:
-            root_node: Starting node for reverse reachable set
-            worker_seed: Random seed for this worker
-            
-        Returns:
-            RRSet object containing reachable nodes
+        Generate RR sets with the compiled multi-threaded driver.
+        
+        A pilot run over the first _PILOT_RR_SETS roots estimates the average
+        RR set size; RR sets are then written in one pass into a member slab
+        oversized by _SLAB_OVERSIZE and kept for reuse by later calls. Any
+        thread-chunk that outgrows its share of the slab finishes its
+        remaining RR sets with exact two-pass sizing. Threads share the CSR
+        arrays in place.
         """
-        # Fix: Convert numpy types to Python int
-        worker_seed = int(worker_seed)
-        root_node = int(root_node)
-        
-        np.random.seed(worker_seed)
-        random.seed(worker_seed)
-        
-        # For LT model, we need to consider node thresholds
-        rr_set = {root_node}
-        
-        # Simplified LT implementation - can be enhanced based on specific requirements
-        # For now, using probabilistic approach similar to IC
-        queue = [root_node]
-        
-        while queue:
-            current = queue.pop(0)
-            
-            for predecessor in self.graph.predecessors(current):
-                edge_prob = self._edge_probs.get((predecessor, current), 0.1)
-                
-                # In LT, threshold is typically sum of incoming edge weights
-                if predecessor not in rr_set and np.random.random() < edge_prob:
-                    rr_set.add(predecessor)
-                    queue.append(predecessor)
-        
-        return RRSet(nodes=rr_set, root_node=root_node, size=len(rr_set))
+        theta = len(roots)
+        offsets = np.zeros(theta + 1, dtype=np.int64)
+        if theta == 0:
+            return offsets, np.empty(0, dtype=np.int32)
+        
+        num_threads = self._set_cpu_threads()
+        csr = (self._lt, self._indptr, self._pred_idx, self._weights_q)
+        
+        pilot = min(_PILOT_RR_SETS, theta)
+        avg_size = _rr_set_sizes(*csr, roots[:pilot], seeds[:pilot], num_threads).mean()
+        capacity = int(np.ceil(_SLAB_OVERSIZE * avg_size * theta))
+        if self._members_slab is None or len(self._members_slab) < capacity:
+            self._members_slab = np.empty(capacity, dtype=np.int32)
+        slab = self._members_slab
+        
+        sizes = np.empty(theta, dtype=np.int64)
+        stops = _fill_rr_set_slab(*csr, roots, seeds, sizes, slab, num_threads)
+        bounds = [c * theta // num_threads for c in range(num_threads + 1)]
+        
+        # Overflowed chunks: size and fill their remaining RR sets exactly
+        overflow = np.concatenate([np.arange(stops[c], bounds[c + 1])
+                                   for c in range(num_threads)])
+        if len(overflow):
+            logger.debug(f"RR set slab overflow: {len(overflow)} RR sets regenerated")
+            sizes[overflow] = _rr_set_sizes(*csr, roots[overflow], seeds[overflow],
+                                            num_threads)
+            overflow_offsets = np.zeros(len(overflow) + 1, dtype=np.int64)
+            np.cumsum(sizes[overflow], out=overflow_offsets[1:])
+            overflow_members = np.empty(overflow_offsets[-1], dtype=np.int32)
+            _generate_all_rr_sets(*csr, roots[overflow], seeds[overflow],
+                                  overflow_offsets, overflow_members, num_threads)
+        
+        np.cumsum(sizes, out=offsets[1:])
+        members = np.empty(offsets[-1], dtype=np.int32)
+        
+        # Compact each chunk's slab slice, then its overflow tail, into place
+        tail = 0
+        for c in range(num_threads):
+            lo, stop, hi = bounds[c], stops[c], bounds[c + 1]
+            start = lo * len(slab) // theta
+            written = offsets[stop] - offsets[lo]
+            members[offsets[lo]:offsets[stop]] = slab[start:start + written]
+            if stop < hi:
+                regenerated = offsets[hi] - offsets[stop]
+                members[offsets[stop]:offsets[hi]] = \
+                    overflow_members[tail:tail + regenerated]
+                tail += regenerated
+        
+        return offsets, members
 
-    def generate_rr_sets(self, theta: int) -> List[RRSet]:
+    def generate_rr_sets(self, theta: int) -> RRSetCollection:
         """
         Generate theta RR sets using parallel processing.
         
+        RR sets are generated by a compiled driver using
+        ``parallel_workers`` threads, or on the GPU for IC with
+        ``device='cuda'``.
+        
         Args:
             theta: Number of RR sets to generate
             
         Returns:
-            List of RRSet objects
+            RRSetCollection holding all RR sets in flat arrays
         """
         logger.info(f"Generating {theta} RR sets using {self.parallel_workers} workers...")
         
-        # Prepare random seeds for each RR set generation
-        np.random.seed(self.random_seed)
-        worker_seeds = np.random.randint(0, 2**31, size=theta)
-        
-        # Randomly select root nodes
-        root_nodes = np.random.choice(self.nodes, size=theta, replace=True)
+        # Independent streams for roots and per-RR-set seeds, derived from
+        # random_seed without touching the global numpy RNG
+        root_seq, seed_seq = np.random.SeedSequence(self.random_seed).spawn(2)
+        worker_seeds = seed_seq.generate_state(theta, dtype=np.uint64)
         
-        # Convert numpy arrays to Python lists to avoid type issues
-        tasks = list(zip([int(r) for r in root_nodes], [int(s) for s in worker_seeds]))
+        # Randomly select root nodes (relabelled indices). Roots (int32, like
+        # members) and seeds (uint64) go to the compiled drivers as-is.
+        root_nodes = np.random.default_rng(root_seq).integers(
+            0, self.num_nodes, size=theta, dtype=np.int32)
         
-        rr_sets = []
-        
-        if self.parallel_workers == 1:
-            # Single-threaded execution
-            for root_node, seed in tasks:
-                if self.diffusion_model == 'IC':
-                    rr_set = self._generate_single_rr_set_ic(root_node, seed)
-                else:
-                    rr_set = self._generate_single_rr_set_lt(root_node, seed)
-                rr_sets.append(rr_set)
+        if self.device == 'cuda':
+            offsets, members = self._generate_ic_batch_cuda(root_nodes, worker_seeds)
         else:
-            # Multi-threaded execution
-            with ProcessPoolExecutor(max_workers=self.parallel_workers) as executor:
-                if self.diffusion_model == 'IC':
-                    futures = {
-                        executor.submit(self._generate_single_rr_set_ic, root, seed): (root, seed)
-                        for root, seed in tasks
-                    }
-                else:
-                    futures = {
-                        executor.submit(self._generate_single_rr_set_lt, root, seed): (root, seed)
-                        for root, seed in tasks
-                    }
-                
-                for future in as_completed(futures):
-                    try:
-                        rr_set = future.result()
-                        rr_sets.append(rr_set)
-                    except Exception as e:
-                        root, seed = futures[future]
-                        logger.error(f"RR set generation failed for root {root}: {e}")
+            offsets, members = self._generate_batch(root_nodes, worker_seeds)
+        
+        rr_sets = RRSetCollection(offsets=offsets, members=members, roots=root_nodes,
+                                  node_ids=self._node_ids)
         
         logger.info(f"Generated {len(rr_sets)} RR sets successfully")
         return rr_sets
 
-    def estimate_influence_spread(self, seed_set: Set[int], rr_sets: List[RRSet]) -> float:
+    def estimate_influence_spread(self, seed_set: Set[int],
+                                  rr_sets: RRSetCollection) -> float:
         """
         Estimate influence spread of seed set using RR sets.
         
+        Uses the collection's node -> RR set inverted index, so repeated
+        queries (e.g. GA fitness evaluations) only touch the RR sets that
+        contain a seed.
+        
         Args:
             seed_set: Set of seed nodes
-            rr_sets: List of RR sets
+            rr_sets: RR sets from generate_rr_sets
             
         Returns:
             Estimated influence spread
         """
-        if not rr_sets:
+        if not len(rr_sets):
             return 0.0
         
-        covered_sets = 0
-        for rr_set in rr_sets:
-            if rr_set.nodes & seed_set:  # Intersection not empty
-                covered_sets += 1
+        seeds = np.array([self._node_index[node] for node in seed_set
+                          if node in self._node_index], dtype=np.int64)
+        inv_indptr, inv_rr_ids = rr_sets.inverted_index()
+        covered_sets = _estimate_influence_kernel(inv_indptr, inv_rr_ids, seeds,
+                                                  len(rr_sets))
         
         # Estimate influence as (covered_rr_sets / total_rr_sets) * num_nodes
         return (covered_sets / len(rr_sets)) * self.num_nodes
 
-    def get_node_coverage(self, rr_sets: List[RRSet]) -> Dict[int, int]:
+    def select_seeds_greedy(self, k: int,
+                            rr_sets: RRSetCollection) -> Tuple[List[int], float]:
         """
-        Get how many RR sets each node covers.
+        Select k seeds by greedy maximum coverage of the RR sets.
+        
+        Works directly on the flat RR sets and their inverted index with
+        lazy (CELF-style) marginal gain updates, so each RR set is visited
+        at most once after it becomes covered.
         
         Args:
-            rr_sets: List of RR sets
+            k: Number of seeds to select
+            rr_sets: RR sets from generate_rr_sets
             
         Returns:
-            Dictionary mapping node_id to coverage count
+            Tuple of (seed node ids in selection order, estimated influence spread)
         """
-        coverage = {node: 0 for node in self.nodes}
+        if not len(rr_sets) or k <= 0:
+            return [], 0.0
         
-        for rr_set in rr_sets:
-            for node in rr_set.nodes:
-                coverage[node] += 1
+        inv_indptr, inv_rr_ids = rr_sets.inverted_index()
+        seeds, covered_sets = _greedy_seed_kernel(rr_sets.offsets, rr_sets.members,
+                                                  inv_indptr, inv_rr_ids, k)
         
-        return coverage
+        return (self._node_ids[seeds].tolist(),
+                (covered_sets / len(rr_sets)) * self.num_nodes)
+
+    def get_node_coverage(self, rr_sets: RRSetCollection) -> Dict[int, int]:
+        """
+        Get how many RR sets each node covers.
+        
+        Args:
+            rr_sets: RR sets from generate_rr_sets
+            
+        Returns:
+            Dictionary mapping node_id to coverage count, in graph node order
+        """
+        counts = self.get_relabelled_coverage(rr_sets)
+        return {node: int(counts[self._node_index[node]]) for node in self.nodes}
+
+    def get_relabelled_coverage(self, rr_sets: RRSetCollection) -> np.ndarray:
+        """
+        Get how many RR sets each relabelled node index covers.
+        
+        Args:
+            rr_sets: RR sets from generate_rr_sets
+            
+        Returns:
+            int64[num_nodes] coverage counts where ``coverage[v]`` belongs to
+            node ``rr_sets.node_ids[v]``
+        """
+        return np.bincount(rr_sets.members, minlength=self.num_nodes)
 
-    def get_statistics(self, rr_sets: List[RRSet]) -> Dict[str, float]:
+    def get_statistics(self, rr_sets: RRSetCollection) -> Dict[str, float]:
         """
         Get statistics about generated RR sets.
         
         Args:
-            rr_sets: List of RR sets
+            rr_sets: RR sets from generate_rr_sets
             
         Returns:
             Dictionary with statistics
         """
-        if not rr_sets:
+        if not len(rr_sets):
             return {}
         
-        sizes = [rr_set.size for rr_set in rr_sets]
+        sizes = rr_sets.sizes
         
         return {
             'total_rr_sets': len(rr_sets),
@@ -270,5 +937,6 @@ class RRSetGenerator:
             'std_rr_set_size': np.std(sizes),
             'min_rr_set_size': np.min(sizes),
             'max_rr_set_size': np.max(sizes),
-            'total_nodes_covered': len(set().union(*[rr_set.nodes for rr_set in rr_sets]))
+            'total_nodes_covered': np.count_nonzero(
+                np.bincount(rr_sets.members, minlength=self.num_nodes))
         }
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Unit tests for configuration loading"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import Config
+
+class TestConfig:
+    """Test cases for Config class."""
+    
+    def test_load_config(self, tmp_path):
+        """Test YAML values override defaults and edits are picked up."""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text('random_seed: 7\nris:\n  theta: 500\n')
+        
+        config = Config(str(config_path))
+        assert config.get('random_seed') == 7
+        assert config.get('log_level') == 'INFO'
+        assert config.ris.theta == 500
+        
+        # Cached parse is not shared between instances
+        config.config_data['ris']['theta'] = 1
+        assert Config(str(config_path)).ris.theta == 500
+        
+        # A modified file is parsed again
+        config_path.write_text('random_seed: 8\n')
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert Config(str(config_path)).get('random_seed') == 8
@@ -0,0 +1,87 @@
+"""Unit tests for HealthNetwork"""
+
+import sys
+from pathlib import Path
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import networkx as nx
+import numpy as np
+from src.data.network import HealthNetwork, PROB_SCALE
+
+class TestHealthNetwork:
+    """Test cases for HealthNetwork class."""
+    
+    def setup_method(self):
+        """Setup test graph."""
+        self.G = nx.DiGraph()
+        self.G.add_edges_from([
+            (0, 1, {'influence_prob': 0.1}),
+            (1, 2, {'influence_prob': 0.2}),
+            (0, 2, {'influence_prob': 0.15}),
+            (2, 3, {'influence_prob': 0.1})
+        ])
+        
+    def test_to_csr(self):
+        """Test reverse CSR lists the predecessors of every node."""
+        csr = HealthNetwork(self.G).to_csr()
+        node_index = {node: i for i, node in enumerate(csr.node_ids.tolist())}
+        
+        indptr = csr.indptr
+        assert csr.num_nodes == 4
+        assert csr.num_edges == self.G.number_of_edges()
+        
+        # Nodes are relabelled by descending in-degree
+        in_degree = [indptr[v + 1] - indptr[v] for v in range(csr.num_nodes)]
+        assert in_degree == sorted(in_degree, reverse=True)
+        
+        for node in self.G.nodes():
+            v = node_index[node]
+            preds = csr.pred_idx[indptr[v]:indptr[v + 1]]
+            probs = csr.pred_prob[indptr[v]:indptr[v + 1]]
+            probs_q = csr.pred_prob_q[indptr[v]:indptr[v + 1]]
+            cum_q = csr.pred_cum_q[indptr[v]:indptr[v + 1]]
+            expected = {
+                node_index[u]: data['influence_prob']
+                for u, _, data in self.G.in_edges(node, data=True)
+            }
+            assert set(preds.tolist()) == set(expected)
+            assert all(a < b for a, b in zip(preds[:-1], preds[1:]))
+            for u, prob, prob_q in zip(preds.tolist(), probs.tolist(),
+                                       probs_q.tolist()):
+                assert prob == pytest.approx(expected[u])
+                assert prob_q / PROB_SCALE == pytest.approx(expected[u], abs=1e-4)
+            assert (cum_q / PROB_SCALE).tolist() == pytest.approx(
+                np.cumsum(probs).tolist(), abs=1e-4)
+        
+    @pytest.mark.parametrize('graph', [
+        nx.grid_2d_graph(2, 2).to_directed(),
+        nx.DiGraph([(1, 'x'), ('x', 2), (2, 1)])
+    ])
+    def test_to_csr_non_int_nodes(self, graph):
+        """Test tuple and mixed int/str nodes keep their original ids."""
+        csr = HealthNetwork(graph).to_csr()
+        
+        assert csr.node_ids.dtype == object
+        assert sorted(map(repr, csr.node_ids.tolist())) == \
+            sorted(map(repr, graph.nodes()))
+        assert csr.num_edges == graph.number_of_edges()
+        
+    def test_demographic_groups(self):
+        """Test nodes are grouped by demographic in insertion order."""
+        network = HealthNetwork()
+        network.add_node(3, demographic_group='youth')
+        network.add_node(1, demographic_group='elderly')
+        network.add_node(2, demographic_group='youth')
+        
+        network.add_node('x', demographic_group='youth')
+        
+        groups = network.get_demographic_groups()
+        assert groups == {
+            'youth': [3, 2, 'x'],
+            'elderly': [1]
+        }
+        assert list(groups) == ['youth', 'elderly']
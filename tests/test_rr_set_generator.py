@@ -1,5 +1,7 @@
 """Proper unit tests for RR Set Generator"""
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 import pytest
@@ -9,6 +11,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import networkx as nx
+from numba import cuda
+from src.ris import rr_set_generator
 from src.ris.rr_set_generator import RRSetGenerator
 from src.utils.logger import setup_logger
 
@@ -35,6 +39,7 @@ class TestRRSetGenerator:
         )
         
         assert generator.num_nodes == 4
+        assert generator.nodes == list(self.G.nodes())
         assert generator.diffusion_model == 'IC'
         assert generator.parallel_workers == 2
         
@@ -53,6 +58,170 @@ class TestRRSetGenerator:
         assert all(isinstance(rr_set.nodes, set) for rr_set in rr_sets)
         assert all(rr_set.root_node in rr_set.nodes for rr_set in rr_sets)
         
+    def test_statistics(self):
+        """Test statistics computed on flat arrays match the RR sets."""
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1)
+        rr_sets = generator.generate_rr_sets(theta=50)
+        stats = generator.get_statistics(rr_sets)
+        
+        sizes = [rr_set.size for rr_set in rr_sets]
+        assert stats['total_rr_sets'] == 50
+        assert stats['avg_rr_set_size'] == pytest.approx(sum(sizes) / 50)
+        assert stats['max_rr_set_size'] == max(sizes)
+        assert stats['total_nodes_covered'] == len(
+            set().union(*[rr_set.nodes for rr_set in rr_sets]))
+        
+    @pytest.mark.parametrize('model', ['IC', 'LT'])
+    def test_rr_set_propagation_extremes(self, model):
+        """Test certain edges are always followed and impossible ones never."""
+        chain = nx.DiGraph()
+        chain.add_edges_from([
+            (0, 1, {'influence_prob': 1.0}),
+            (1, 2, {'influence_prob': 1.0}),
+            (3, 2, {'influence_prob': 0.0})
+        ])
+        generator = RRSetGenerator(graph=chain, diffusion_model=model,
+                                   parallel_workers=1, random_seed=7)
+        expected = {0: {0}, 1: {0, 1}, 2: {0, 1, 2}, 3: {3}}
+        
+        for rr_set in generator.generate_rr_sets(theta=50):
+            assert rr_set.nodes == expected[rr_set.root_node]
+        
+    @pytest.mark.parametrize('model', ['IC', 'LT'])
+    def test_rr_sets_independent_of_workers(self, model):
+        """Test the same seed gives the same RR sets for any worker count."""
+        results = []
+        for workers in (1, 3):
+            generator = RRSetGenerator(graph=self.G, diffusion_model=model,
+                                       parallel_workers=workers, random_seed=42)
+            rr_sets = generator.generate_rr_sets(theta=30)
+            results.append([(rr_set.root_node, rr_set.nodes) for rr_set in rr_sets])
+        
+        assert results[0] == results[1]
+        
+    def test_lt_rr_sets_are_walks(self):
+        """Test LT RR sets take at most one live in-edge per node."""
+        star = nx.DiGraph()
+        star.add_edges_from([
+            (0, 2, {'influence_prob': 0.5}),
+            (1, 2, {'influence_prob': 0.5}),
+            (3, 0, {'influence_prob': 1.0})
+        ])
+        generator = RRSetGenerator(graph=star, diffusion_model='LT',
+                                   parallel_workers=1, random_seed=42)
+        walks = [rr_set.nodes for rr_set in generator.generate_rr_sets(theta=200)
+                 if rr_set.root_node == 2]
+        
+        # In-weights at node 2 sum to 1, so exactly one predecessor is live
+        assert walks
+        assert all(nodes in ({0, 2, 3}, {1, 2}) for nodes in walks)
+        assert {0, 2, 3} in walks and {1, 2} in walks
+        
+    def test_rr_set_slab_overflow(self, monkeypatch):
+        """Test RR sets overflowing the member slab are still complete."""
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1, random_seed=42)
+        expected = [(rr_set.root_node, rr_set.nodes)
+                    for rr_set in generator.generate_rr_sets(theta=30)]
+        
+        monkeypatch.setattr(rr_set_generator, '_SLAB_OVERSIZE', 0.2)
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1, random_seed=42)
+        rr_sets = generator.generate_rr_sets(theta=30)
+        
+        assert [(rr_set.root_node, rr_set.nodes) for rr_set in rr_sets] == expected
+        
+    @pytest.mark.skipif(not cuda.is_available(), reason="CUDA not available")
+    def test_cuda_matches_cpu(self, monkeypatch):
+        """Test GPU RR sets are identical to CPU ones, including overflow."""
+        G = nx.gnp_random_graph(60, 0.08, directed=True, seed=1)
+        nx.set_edge_attributes(G, 0.3, 'influence_prob')
+        expected = RRSetGenerator(graph=G, parallel_workers=1).generate_rr_sets(200)
+        
+        # A tiny pilot undersizes thread slices (overflow), and small launches
+        # force several launches per call
+        monkeypatch.setattr(rr_set_generator, '_PILOT_RR_SETS', 4)
+        monkeypatch.setattr(rr_set_generator, '_CUDA_MAX_SLOTS', 512)
+        generator = RRSetGenerator(graph=G, parallel_workers=1, device='cuda')
+        rr_sets = generator.generate_rr_sets(200)
+        
+        assert generator.device == 'cuda'
+        assert (rr_sets.offsets == expected.offsets).all()
+        assert (rr_sets.members == expected.members).all()
+        
+    @pytest.mark.skipif(os.environ.get('NUMBA_ENABLE_CUDASIM') == '1',
+                        reason="already running under the CUDA simulator")
+    def test_cuda_matches_cpu_simulated(self):
+        """Run the CUDA test under numba's CUDA simulator so it needs no GPU."""
+        env = dict(os.environ, NUMBA_ENABLE_CUDASIM='1')
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+             f'{__file__}::TestRRSetGenerator::test_cuda_matches_cpu'],
+            env=env, capture_output=True, text=True)
+        
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert '1 passed' in result.stdout
+        
+    def test_collection_indexing(self):
+        """Test the collection indexes like a list of RR sets."""
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1)
+        rr_sets = generator.generate_rr_sets(theta=10)
+        as_list = list(rr_sets)
+        
+        assert rr_sets[-1] == as_list[-1]
+        assert rr_sets[-10] == as_list[0]
+        with pytest.raises(IndexError):
+            rr_sets[10]
+        with pytest.raises(IndexError):
+            rr_sets[-11]
+        with pytest.raises(TypeError):
+            rr_sets[1:3]
+        
+        # Collections compare by identity, like other array containers
+        assert rr_sets == rr_sets
+        assert rr_sets != generator.generate_rr_sets(theta=10)
+        
+    def test_inverted_index(self):
+        """Test the node -> RR set index is the transpose of the RR sets."""
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1)
+        rr_sets = generator.generate_rr_sets(theta=50)
+        inv_indptr, inv_rr_ids = rr_sets.inverted_index()
+        
+        for node in self.G.nodes():
+            v = generator._node_index[node]
+            rr_ids = inv_rr_ids[inv_indptr[v]:inv_indptr[v + 1]].tolist()
+            expected = [i for i, rr_set in enumerate(rr_sets) if node in rr_set.nodes]
+            assert rr_ids == expected
+        
+    @pytest.mark.parametrize('relabel', [None, {0: -1, 1: 'b', 2: 'c', 3: 10**9}])
+    def test_node_coverage(self, relabel):
+        """Test coverage counts the RR sets containing each node, for any ids."""
+        graph = nx.relabel_nodes(self.G, relabel) if relabel else self.G
+        generator = RRSetGenerator(graph=graph, parallel_workers=1)
+        rr_sets = generator.generate_rr_sets(theta=50)
+        coverage = generator.get_node_coverage(rr_sets)
+        
+        assert list(coverage) == list(graph.nodes())
+        for node in graph.nodes():
+            expected = sum(1 for rr_set in rr_sets if node in rr_set.nodes)
+            assert coverage[node] == expected
+        
+        relabelled = generator.get_relabelled_coverage(rr_sets)
+        assert dict(zip(rr_sets.node_ids.tolist(), relabelled.tolist())) == coverage
+        
+    def test_select_seeds_greedy(self):
+        """Test greedy seeds and their spread agree with the estimator."""
+        generator = RRSetGenerator(graph=self.G, parallel_workers=1)
+        rr_sets = generator.generate_rr_sets(theta=200)
+        
+        seeds, spread = generator.select_seeds_greedy(2, rr_sets)
+        
+        assert len(seeds) == len(set(seeds)) == 2
+        assert spread == pytest.approx(
+            generator.estimate_influence_spread(set(seeds), rr_sets))
+        
+        # First pick is the node appearing in the most RR sets
+        coverage = generator.get_node_coverage(rr_sets)
+        assert coverage[seeds[0]] == max(coverage.values())
+        
     def test_influence_estimation(self):
         """Test influence spread estimation."""
         generator = RRSetGenerator(
@@ -69,6 +238,10 @@ class TestRRSetGenerator:
         assert isinstance(influence, float)
         assert influence >= 0
         assert influence <= 4  # Can't exceed number of nodes
+        
+        # Matches a direct count over the materialized RR sets
+        covered = sum(1 for rr_set in rr_sets if rr_set.nodes & seed_set)
+        assert influence == pytest.approx(covered / len(rr_sets) * 4)
 
 # For backward compatibility with direct execution
 def test_basic_functionality():